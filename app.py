@@ -1,10 +1,15 @@
+import hashlib
+import inspect
+import os
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 
+# Copy-on-Write: filtered frames are lazy views and can never write back into
+# the cached source data, so read-only slices don't need defensive .copy()s
+pd.set_option('mode.copy_on_write', True)
+
 # ============================================================================
 # PAGE CONFIG
 # ============================================================================
@@ -18,7 +23,7 @@ st.set_page_config(
 # ============================================================================
 # CUSTOM CSS
 # ============================================================================
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -69,6 +74,19 @@ st.markdown("""
     .action-card:hover {
         transform: translateX(5px);
     }
+    .card-metrics {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 0.8rem 1rem;
+    }
+    .card-metric-label {
+        font-size: 0.875rem;
+        color: #5D6D7E;
+    }
+    .card-metric-value {
+        font-size: 1.6rem;
+        color: #2C3E50;
+    }
     /* Make metrics bigger */
     .stMetric {
         font-size: 1.2rem !important;
@@ -77,7 +95,18 @@ st.markdown("""
         font-size: 2rem !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+# Collapse whitespace once at import; Streamlit drops elements that aren't
+# re-emitted, so the stylesheet is still sent every rerun - just smaller
+CUSTOM_CSS = ' '.join(CUSTOM_CSS.split())
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# Title and subtitle, sent as a single element
+HEADER_HTML = (
+    '<h1 class="main-header">🎯 Shopify App Store Product Strategy Dashboard</h1>\n'
+    '<p class="sub-header">Uncovering Quality Gaps and Merchant Pain Points to Prioritize Platform Improvements</p>'
+)
 
 # ============================================================================
 # SESSION STATE INITIALIZATION
@@ -94,27 +123,646 @@ if 'clicked_metric_tab1' not in st.session_state:
 # ============================================================================
 # LOAD DATA
 # ============================================================================
-@st.cache_data
-def load_query1_data():
+QUERY1_CSV = 'query1_results.csv'
+SCORE_COLUMNS = ['Quality Severity (0-100)', 'Merchant Impact (0-100)', 'Business Priority (0-100)']
+
+def read_csv_via_parquet(csv_path):
+    """Read a results CSV through a sibling Parquet copy, regenerating it when the CSV is newer"""
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if (os.path.exists(parquet_path)
+            and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)):
+        return pd.read_parquet(parquet_path)
+    
+    df = pd.read_csv(csv_path)
+    try:
+        df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+    except (OSError, ValueError, TypeError):
+        # Read-only deployments, and columns Arrow cannot type (ArrowInvalid and
+        # ArrowTypeError subclass ValueError/TypeError), just keep parsing the CSV
+        pass
+    return df
+
+@st.cache_data(persist="disk", show_spinner=False)
+def load_query1_data(csv_path, csv_mtime):
     """Load Query 1 data"""
-    df = pd.read_csv('query1_results.csv')
+    # csv_mtime is only part of the cache key: the disk cache would otherwise
+    # outlive an updated CSV, since a no-argument function has a single entry
+    df = read_csv_via_parquet(csv_path)
+    
+    # Downcast numeric columns so Plotly receives compact typed arrays
+    int_cols = df.select_dtypes('integer').columns
+    df[int_cols] = df[int_cols].apply(pd.to_numeric, downcast='integer')
+    float_cols = df.select_dtypes('float').columns
+    df[float_cols] = df[float_cols].apply(pd.to_numeric, downcast='float')
+    
+    # 0-100 scores and the 1-5 priority level are small whole numbers; store them
+    # as int8, rounded as the detail views' :.0f formatting did, so text labels
+    # can use them directly. Columns with missing values keep their float dtype
+    # (int8 has no NaN). Signed on purpose: Plotly Express only treats 'i'/'f'
+    # dtypes as continuous, so uint8 would turn color scales discrete
+    for col in SCORE_COLUMNS + ['Priority Level (1-5)']:
+        if df[col].notna().all():
+            df[col] = df[col].round().astype(np.int8)
+    
+    # Low-cardinality labels: filters compare integer codes instead of strings,
+    # and the handful of recommended-action texts are stored once each.
+    # Feature Category stays a string - it is unique per row, so codes buy nothing
+    df = df.astype({
+        'Strategic Segment': 'category',
+        'Demand Level': 'category',
+        'Action Timeline': 'category'
+    })
+    # The action text is optional in the source (the detail views skip it when absent)
+    if "What Should Shopify Do?" in df.columns:
+        df["What Should Shopify Do?"] = df["What Should Shopify Do?"].astype('category')
+    
+    # Pre-formatted display strings shared by the detail views
+    df['_rating_str'] = df['Current Avg Rating'].map('{:.2f}★'.format)
+    df['_gap_str'] = df['Quality vs Median'].map('{:.3f}★'.format)
+    df['_affected_k'] = df['Est. Merchants Affected'].map(
+        lambda v: f"~{int(v / 1000)}K" if pd.notna(v) else 'N/A'
+    )
+    df['_churn_str'] = df['Predicted Churn %'].map('{:.1f}%'.format)
+    
+    # Content hash taken once here so whole-frame helpers can key on it (see
+    # SOURCE_FRAME_HASH) instead of re-hashing every cell on every rerun
+    df.attrs['fingerprint'] = hashlib.md5(
+        pd.util.hash_pandas_object(df).to_numpy().tobytes()
+    ).hexdigest()
     return df
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
+# st.fragment is Streamlit >= 1.37 (experimental_fragment in 1.33); on older
+# versions the detail views simply rerun with the rest of the script
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+# Row selection on st.dataframe is Streamlit >= 1.35; older versions fall back
+# to a selectbox + button for opening a category's detail view
+DATAFRAME_SELECTION = 'on_select' in inspect.signature(st.dataframe).parameters
+
+# Cache key for helpers that take the whole loaded frame: the fingerprint set in
+# load_query1_data. pandas carries attrs over to slices, so never use this on a
+# helper that may receive a subset - those keep Streamlit's default hashing
+SOURCE_FRAME_HASH = {pd.DataFrame: lambda df: df.attrs['fingerprint']}
+
+# Segment color scheme, built once at import instead of on every lookup
+SEGMENT_COLORS = {
+    'Below Standard Performance': '#C0392B',  # Deep red - most negative
+    'Low Demand, Quality Gap': '#E74C3C',     # Red - negative
+    'High Demand, Minor Gap': '#F39C12',       # Orange - neutral/caution
+    'Underutilized Quality': '#3498DB',        # Blue - neutral/opportunity
+    'High Demand, Good Quality': '#27AE60',    # Dark green - positive (combined)
+    'Meeting Expectations': '#27AE60'          # Dark green - positive (will be combined)
+}
+DEFAULT_SEGMENT_COLOR = '#95A5A6'
+
+# Segments ordered from negative to positive (the color map is listed that way)
+SEGMENT_ORDER = tuple(SEGMENT_COLORS)
+
+# Scatter rendering thresholds (number of categories plotted)
+SCATTER_LABEL_MAX_POINTS = 15
+SCATTER_WEBGL_MIN_POINTS = 50
+# Beyond this many points a scatter keeps only one point per screen bin
+SCATTER_MAX_POINTS = 2000
+
 def get_segment_color(segment):
     """Get color for segment with improved color scheme"""
-    segment_colors = {
-        'Below Standard Performance': '#C0392B',  # Deep red - most negative
-        'Low Demand, Quality Gap': '#E74C3C',     # Red - negative
-        'High Demand, Minor Gap': '#F39C12',       # Orange - neutral/caution
-        'Underutilized Quality': '#3498DB',        # Blue - neutral/opportunity
-        'High Demand, Good Quality': '#27AE60',    # Dark green - positive (combined)
-        'Meeting Expectations': '#27AE60'          # Dark green - positive (will be combined)
+    return SEGMENT_COLORS.get(segment, DEFAULT_SEGMENT_COLOR)
+
+@st.cache_resource(show_spinner=False, hash_funcs=SOURCE_FRAME_HASH)
+def segments_index(df):
+    """Split the data into per-segment frames once so lookups are a dict hit"""
+    return dict(tuple(df.groupby('Strategic Segment', sort=False, observed=True)))
+
+@st.cache_data(show_spinner=False, hash_funcs=SOURCE_FRAME_HASH)
+def segment_aggregates(df):
+    """Per-segment summary metrics for the segment detail header"""
+    return df.groupby('Strategic Segment', sort=False, observed=True).agg(
+        n=('Feature Category', 'size'),
+        avg_quality=('Quality Severity (0-100)', 'mean'),
+        avg_impact=('Merchant Impact (0-100)', 'mean'),
+        total_affected=('Est. Merchants Affected', 'sum'),
+        max_quality=('Quality Severity (0-100)', 'max')
+    ).assign(has_issues=lambda agg: agg['max_quality'] > 0).to_dict(orient='index')
+
+@st.cache_resource(show_spinner=False, hash_funcs=SOURCE_FRAME_HASH)
+def categories_index(df):
+    """Map each category to a plain dict of its row for O(1) detail lookups"""
+    # keep='first' matches the old mask-and-iloc[0] lookup on a repeated name
+    return (df.drop_duplicates('Feature Category', keep='first')
+            .set_index('Feature Category').to_dict(orient='index'))
+
+@st.cache_resource(show_spinner=False)
+def build_segment_scatter(segment_df, segment, color):
+    """Build the Quality Severity vs Merchant Impact scatter for a segment"""
+    import plotly.express as px
+    
+    fig_scatter = px.scatter(
+        reduce_for_scatter(segment_df, 'Merchant Impact (0-100)', 'Quality Severity (0-100)'),
+        x='Merchant Impact (0-100)',
+        y='Quality Severity (0-100)',
+        size='Business Priority (0-100)',
+        hover_name='Feature Category',
+        # Per-point labels are one SVG text node each; busy segments rely on hover
+        text='Feature Category' if len(segment_df) <= SCATTER_LABEL_MAX_POINTS else None,
+        # Gap, app count and churn are already in the expanders below the chart
+        hover_data={
+            'Current Avg Rating': ':.2f',
+            'Est. Merchants Affected': ':,',
+            'Feature Category': False
+        },
+        title=f"Categories in {segment}",
+        # Apply segment color to all bubbles
+        color_discrete_sequence=[color],
+        # WebGL only pays off for large segments; small ones keep crisp SVG labels
+        render_mode='webgl' if len(segment_df) > SCATTER_WEBGL_MIN_POINTS else 'svg'
+    )
+    
+    fig_scatter.update_traces(
+        textposition='top center',
+        textfont_size=9
+    )
+    
+    fig_scatter.update_layout(height=500)
+    return fig_scatter
+
+@st.cache_data(show_spinner=False)
+def build_segment_performance_table(segment_df):
+    """Build the performance table for segments without quality issues"""
+    return segment_df[[
+        'Feature Category', 
+        'Current Avg Rating',
+        '# of Apps',
+        'Est. Merchants Affected',
+        '% Apps with 4.5+ Stars'
+    ]].sort_values('Est. Merchants Affected', ascending=False)
+
+@st.cache_resource(show_spinner=False)
+def build_heatmap_figure(top_df):
+    """Build the score-breakdown heatmap for the top categories by priority"""
+    import plotly.graph_objects as go
+    
+    # The transposed score matrix doubles as the cell labels (the texttemplate
+    # rounds, for score columns left float by missing values); z gets one
+    # contiguous float32 copy (metrics x categories)
+    heatmap_scores = top_df[['Quality Severity (0-100)', 'Merchant Impact (0-100)', 
+                             'Business Priority (0-100)']].to_numpy().T
+    heatmap_z = np.ascontiguousarray(heatmap_scores, dtype=np.float32)
+    
+    fig_heatmap = go.Figure(data=go.Heatmap(
+        z=heatmap_z,
+        x=top_df['Feature Category'].to_numpy(),
+        y=['Quality Severity', 'Merchant Impact', 'Business Priority'],
+        colorscale='RdYlGn_r',
+        text=heatmap_scores,
+        texttemplate='%{text:.0f}',
+        textfont={"size": 10},
+        hoverongaps=False,
+        hovertemplate='<b>%{y}</b><br>%{x}<br>Score: %{z:.0f}/100<extra></extra>',
+        colorbar=dict(title="Score")
+    ))
+    
+    fig_heatmap.update_layout(
+        title="Top 25 Categories by Business Priority - Score Breakdown",
+        height=400,
+        xaxis={'side': 'bottom', 'tickangle': -45},
+        yaxis_title="Metric"
+    )
+    return fig_heatmap
+
+@st.cache_resource(show_spinner=False)
+def build_segment_pie(segment_counts, colors):
+    """Build the category-distribution donut for the segment overview"""
+    import plotly.graph_objects as go
+    
+    # Create pie chart with better formatting
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=segment_counts.index,
+        values=segment_counts.to_numpy(),
+        hole=0.4,
+        marker=dict(colors=colors),
+        textposition='outside',
+        textinfo='label+percent',
+        textfont=dict(size=12),
+        hovertemplate='<b>%{label}</b><br>Categories: %{value}<br>Percentage: %{percent}<extra></extra>'
+    )])
+    
+    fig_pie.update_layout(
+        showlegend=True,
+        height=450,
+        legend=dict(
+            orientation="v",
+            yanchor="middle",
+            y=0.5,
+            xanchor="left",
+            x=1.1
+        )
+    )
+    return fig_pie
+
+def ascending_bar_rows(df, col):
+    """Rows ordered smallest-first, the bottom-up order of a horizontal bar chart"""
+    # Stable, like plotly.js's own 'total ascending' sort, so ties stack the same
+    # way; the browser then draws categories in trace order with no sort pass
+    return df.iloc[np.argsort(df[col].to_numpy(), kind='stable')]
+
+# Layout shared by the two Priority Analysis bar charts, which sit side by side
+PRIORITY_BAR_LAYOUT = dict(height=500, yaxis_title="", showlegend=False)
+
+@st.cache_resource(show_spinner=False)
+def build_problems_chart(problems_df):
+    """Build the top-problems bar chart for the priority analysis tab"""
+    import plotly.graph_objects as go
+    
+    problems_df = ascending_bar_rows(problems_df, 'Business Priority (0-100)')
+    fig_problems = go.Figure()
+    
+    fig_problems.add_trace(go.Bar(
+        y=problems_df['Feature Category'].to_numpy(),
+        x=problems_df['Business Priority (0-100)'].to_numpy(),
+        orientation='h',
+        marker=dict(
+            color=problems_df['Business Priority (0-100)'].to_numpy(),
+            colorscale='Reds',
+            showscale=False
+        ),
+        text=problems_df['Business Priority (0-100)'].to_numpy(),
+        texttemplate='%{text:.0f}',
+        textposition='outside',
+        hovertemplate='<b>%{y}</b><br>Business Priority: %{x}/100<br>%{customdata}<extra></extra>',
+        customdata=problems_df['Action Timeline'].to_numpy()
+    ))
+    
+    fig_problems.update_layout(**PRIORITY_BAR_LAYOUT, xaxis_title="Business Priority Score")
+    return fig_problems
+
+@st.cache_resource(show_spinner=False)
+def build_severity_chart(severity_chart_df):
+    """Build the highest-severity bar chart for the priority analysis tab"""
+    import plotly.graph_objects as go
+    
+    severity_chart_df = ascending_bar_rows(severity_chart_df, 'Quality Severity (0-100)')
+    fig_severity = go.Figure()
+    
+    fig_severity.add_trace(go.Bar(
+        y=severity_chart_df['Feature Category'].to_numpy(),
+        x=severity_chart_df['Quality Severity (0-100)'].to_numpy(),
+        orientation='h',
+        marker=dict(
+            color=severity_chart_df['Quality Severity (0-100)'].to_numpy(),
+            colorscale='Reds',
+            showscale=False
+        ),
+        text=severity_chart_df['Quality Severity (0-100)'].to_numpy(),
+        texttemplate='%{text:.0f}',
+        textposition='outside',
+        hovertemplate='<b>%{y}</b><br>Quality Severity: %{x}/100<br>Gap: %{customdata[0]:.3f}★<br>Rating: %{customdata[1]:.2f}★<extra></extra>',
+        customdata=np.column_stack([
+            severity_chart_df['Quality vs Median'].to_numpy(dtype=np.float32),
+            severity_chart_df['Current Avg Rating'].to_numpy(dtype=np.float32)
+        ])
+    ))
+    
+    fig_severity.update_layout(**PRIORITY_BAR_LAYOUT, xaxis_title="Quality Severity Score")
+    return fig_severity
+
+@st.cache_resource(show_spinner=False)
+def build_urgent_chart(urgent_df):
+    """Build the Business Priority breakdown for the urgent drill-down"""
+    import plotly.graph_objects as go
+    
+    bar_df = ascending_bar_rows(urgent_df, 'Business Priority (0-100)')
+    
+    fig_urgent = go.Figure()
+    
+    # Use a gradient color scale based on priority level
+    bp = bar_df['Business Priority (0-100)'].to_numpy(dtype=np.float64) / 100
+    red = (192 - bp * 130).astype(np.int16)
+    green = (57 + bp * 130).astype(np.int16)
+    colors = [f'rgb({r}, {g}, 43)' for r, g in zip(red.tolist(), green.tolist())]
+    
+    fig_urgent.add_trace(go.Bar(
+        y=bar_df['Feature Category'].to_numpy(),
+        x=bar_df['Business Priority (0-100)'].to_numpy(),
+        orientation='h',
+        marker=dict(
+            color=colors,
+            line=dict(color='white', width=1)
+        ),
+        text=bar_df['Business Priority (0-100)'].to_numpy(),
+        texttemplate='%{text:.0f}',
+        textposition='outside',
+        hovertemplate='<b>%{y}</b><br>' +
+                     'Business Priority: %{x}/100<br>' +
+                     'Quality Severity: %{customdata[0]}/100<br>' +
+                     'Merchant Impact: %{customdata[1]}/100<br>' +
+                     '<extra></extra>',
+        customdata=np.column_stack([
+            bar_df['Quality Severity (0-100)'].to_numpy(),
+            bar_df['Merchant Impact (0-100)'].to_numpy()
+        ])
+    ))
+    
+    fig_urgent.update_layout(
+        height=max(400, len(bar_df) * 50),
+        xaxis_title="Business Priority Score (0-100)",
+        yaxis_title="",
+        showlegend=False
+    )
+    return fig_urgent
+
+@st.cache_resource(show_spinner=False)
+def build_severity_scatter(severity_df):
+    """Build the severity vs impact scatter for the severity drill-down"""
+    import plotly.express as px
+    
+    # Only the columns the chart references go to Plotly Express
+    severity_plot_df = reduce_for_scatter(
+        severity_df[['Feature Category', 'Merchant Impact (0-100)', 'Quality Severity (0-100)',
+                     'Business Priority (0-100)', 'Current Avg Rating', 'Quality vs Median',
+                     'Est. Merchants Affected', 'Predicted Churn %']],
+        'Merchant Impact (0-100)', 'Quality Severity (0-100)'
+    )
+    fig_sev = px.scatter(
+        severity_plot_df,
+        x='Merchant Impact (0-100)',
+        y='Quality Severity (0-100)',
+        size='Business Priority (0-100)',
+        color='Business Priority (0-100)',
+        hover_name='Feature Category',
+        text='Feature Category',
+        hover_data={
+            'Current Avg Rating': ':.2f',
+            'Quality vs Median': ':.3f',
+            'Est. Merchants Affected': ':,',
+            'Predicted Churn %': ':.1f',
+            'Feature Category': False
+        },
+        color_continuous_scale='Reds',
+        title="App Quality Issues by Category: Quality Severity vs Merchant Impact",
+        # Same switch-over as the segment scatter: WebGL only once SVG gets heavy
+        render_mode='webgl' if len(severity_plot_df) > SCATTER_WEBGL_MIN_POINTS else 'svg'
+    )
+    
+    # Update text position to avoid overlap
+    fig_sev.update_traces(
+        textposition='top center',
+        textfont_size=9
+    )
+    
+    fig_sev.update_layout(height=600)
+    return fig_sev
+
+@st.cache_resource(show_spinner=False)
+def build_demand_chart(vh_df, market_col):
+    """Build the market-opportunity bar chart for the demand drill-down"""
+    import plotly.express as px
+    
+    has_market_size = market_col == 'Total Reviews (Market Size)'
+    
+    # dict.fromkeys drops the duplicate when market_col falls back to merchants affected
+    vh_plot_df = vh_df[list(dict.fromkeys([
+        'Feature Category', market_col, 'Est. Merchants Affected',
+        'Current Avg Rating', 'Business Priority (0-100)', '# of Apps'
+    ]))]
+    
+    fig_vh_comparison = px.bar(
+        vh_plot_df.sort_values(market_col, ascending=True) if has_market_size else vh_plot_df,
+        y='Feature Category',
+        x=market_col,
+        orientation='h',
+        color='Est. Merchants Affected',
+        color_continuous_scale='RdYlGn',
+        hover_data={
+            'Current Avg Rating': ':.2f',
+            'Business Priority (0-100)': True,
+            'Est. Merchants Affected': ':,',
+            '# of Apps': True
+        },
+        title="High-Demand Categories by Market Size & Merchant Impact",
+        labels={
+            'Total Reviews (Market Size)': 'Market Size (Reviews)',
+            'Est. Merchants Affected': 'Merchants Affected'
+        }
+    )
+    
+    fig_vh_comparison.update_layout(height=600)
+    return fig_vh_comparison
+
+@st.cache_resource(show_spinner=False)
+def build_affected_chart(affected_df):
+    """Build the top merchants-affected bar chart for the affected drill-down"""
+    import plotly.express as px
+    
+    fig_affected = px.bar(
+        ascending_bar_rows(affected_df, 'Est. Merchants Affected')[[
+            'Feature Category', 'Est. Merchants Affected', 'Business Priority (0-100)',
+            'Quality Severity (0-100)', 'Merchant Impact (0-100)', 'Current Avg Rating',
+            'Quality vs Median', 'Demand Level'
+        ]],
+        y='Feature Category',
+        x='Est. Merchants Affected',
+        orientation='h',
+        color='Business Priority (0-100)',
+        color_continuous_scale='Reds',
+        hover_data={
+            'Quality Severity (0-100)': True,
+            'Merchant Impact (0-100)': True,
+            'Current Avg Rating': ':.2f',
+            'Quality vs Median': ':.3f',
+            'Demand Level': True
+        },
+        title="Top 15 Categories by Merchants Affected"
+    )
+    
+    fig_affected.update_layout(
+        height=600,
+        xaxis_title="Estimated Merchants Affected",
+        yaxis_title=""
+    )
+    return fig_affected
+
+HERO_CARD_TEMPLATE = (
+    "<div style='text-align: center; padding: 2rem; background: linear-gradient(135deg, {color_from} 0%, {color_to} 100%); "
+    "border-radius: 10px; color: white; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>"
+    "<h1 style='color: white; margin: 0; font-size: 3rem;'>{value}</h1>"
+    "<p style='margin: 0.5rem 0 0 0; font-size: 1.1rem; font-weight: 600;'>{label}</p>"
+    "</div>"
+)
+
+# (button key, drill-down name, gradient start, gradient end, label) per hero card
+HERO_CARDS = (
+    ('hero1', 'urgent', '#E74C3C', '#C0392B', 'Actionable<br>Priority Categories'),
+    ('hero2', 'severity', '#E67E22', '#D35400', 'Quality Severity<br>Issues'),
+    ('hero3', 'demand', '#3498DB', '#2980B9', 'Very High Demand<br>Categories'),
+    ('hero4', 'affected', '#9B59B6', '#8E44AD', 'Merchants Affected<br>by Quality Gaps')
+)
+
+URGENT_CARD_TEMPLATE = (
+    '<div style="padding: 1.2rem; border-radius: 10px; border-left: 5px solid {color}; '
+    'background: white; margin-bottom: 1rem; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">'
+    '<h4 style="margin: 0 0 0.5rem 0; color: {color};">'
+    '{emoji} {category} - Business Priority: {priority:.0f}/100</h4>'
+    '<div class="card-metrics">'
+    '<div><div class="card-metric-label">Quality Severity</div><div class="card-metric-value">{severity:.0f}/100</div></div>'
+    '<div><div class="card-metric-label">Merchant Impact</div><div class="card-metric-value">{impact:.0f}/100</div></div>'
+    '<div><div class="card-metric-label">Demand Level</div><div class="card-metric-value">{demand}</div></div>'
+    '<div><div class="card-metric-label">Current Rating</div><div class="card-metric-value">{rating}</div></div>'
+    '<div><div class="card-metric-label">Merchants Affected</div><div class="card-metric-value">~{affected:,.0f}</div></div>'
+    '<div><div class="card-metric-label">Predicted Churn</div><div class="card-metric-value">{churn}</div></div>'
+    '</div></div>'
+)
+
+@st.cache_data(show_spinner=False)
+def build_urgent_cards_html(urgent_df):
+    """Render all urgent action cards into one HTML string"""
+    # Rating and churn reuse the display strings formatted once at load
+    cards = []
+    for category, level, priority, severity, impact, demand, rating, affected, churn in urgent_df[[
+        'Feature Category', 'Priority Level (1-5)', 'Business Priority (0-100)',
+        'Quality Severity (0-100)', 'Merchant Impact (0-100)', 'Demand Level',
+        '_rating_str', 'Est. Merchants Affected', '_churn_str'
+    ]].itertuples(index=False, name=None):
+        cards.append(URGENT_CARD_TEMPLATE.format(
+            color="#C0392B" if level == 1 else "#E67E22" if level == 2 else "#F39C12",
+            emoji="🔴" if level == 1 else "🟠" if level == 2 else "🟡",
+            category=category,
+            priority=priority,
+            severity=severity,
+            impact=impact,
+            demand=demand,
+            rating=rating,
+            affected=affected,
+            churn=churn
+        ))
+    return ''.join(cards)
+
+def rank_by_priority(df):
+    """Row positions ordered by Business Priority, highest first"""
+    # Stable so ties keep file order exactly as nlargest(keep='first') did
+    return np.argsort(-df['Business Priority (0-100)'].to_numpy(), kind='stable')
+
+@st.cache_data(show_spinner=False, hash_funcs=SOURCE_FRAME_HASH)
+def priority_sorted(df):
+    """The data ordered by Business Priority once, for every priority-ranked view to slice"""
+    return df.iloc[rank_by_priority(df)]
+
+def reduce_for_scatter(df, x, y, max_points=SCATTER_MAX_POINTS):
+    """Keep the highest-priority point per 2D bin once a frame exceeds max_points"""
+    if len(df) <= max_points:
+        return df
+    
+    bins = int(np.sqrt(max_points))
+    
+    def bin_index(values):
+        values = values.to_numpy(dtype=np.float64)
+        span = values.max() - values.min()
+        if not span:
+            return np.zeros(len(values), dtype=np.int64)
+        return np.minimum(((values - values.min()) / span * bins).astype(np.int64), bins - 1)
+    
+    bin_key = bin_index(df[x]) * bins + bin_index(df[y])
+    # Walk rows by priority so each bin's first hit is its top category,
+    # then restore the original row order for the chart
+    order = rank_by_priority(df)
+    _, first = np.unique(bin_key[order], return_index=True)
+    return df.iloc[np.sort(order[first])]
+
+@st.cache_data(show_spinner=False, hash_funcs=SOURCE_FRAME_HASH)
+def compute_overview_metrics(df):
+    """Compute the counts and frames every main dashboard rerun needs"""
+    # Hero cards only need scalars; the drill-down frames are fetched lazily by
+    # the drill-down that is actually open (see the get_* helpers below)
+    quality_gap_mask = df['Quality vs Median'].to_numpy() < 0
+    high_severity_mask = df['Quality Severity (0-100)'].to_numpy() >= 25
+    
+    top25 = priority_sorted(df).iloc[:25]
+    top10 = top25.iloc[:10]
+    problems_df = top10[top10['Business Priority (0-100)'] > 0]
+    severity_chart_df = df.loc[high_severity_mask].nlargest(10, 'Quality Severity (0-100)')
+    
+    # Get segment counts, combining Meeting Expectations into High Demand Good Quality
+    segment_counts = df['Strategic Segment'].replace(
+        {'Meeting Expectations': 'High Demand, Good Quality'}
+    ).value_counts()
+    
+    # Pie colors via the categorical codes: one palette entry per category,
+    # gathered with a single integer take instead of a dict lookup per slice
+    palette = np.array([get_segment_color(c) for c in segment_counts.index.categories], dtype=object)
+    
+    return {
+        'urgent_count': len(top10),
+        'high_severity_count': int(high_severity_mask.sum()),
+        'very_high_count': int((df['Demand Level'] == 'Very High').sum()),
+        # nansum skips missing counts, as the pandas Series.sum() it replaced did
+        'total_affected': np.nansum(df['Est. Merchants Affected'].to_numpy()[quality_gap_mask]),
+        'segment_counts': segment_counts,
+        'segment_colors': palette[segment_counts.index.codes].tolist(),
+        'problems_df': problems_df,
+        'top25': top25,
+        'severity_chart_df': severity_chart_df,
+        # View Details selector: order-preserving union of both top-10 lists
+        'priority_categories': tuple(dict.fromkeys(
+            problems_df['Feature Category'].tolist()
+            + severity_chart_df['Feature Category'].tolist()
+        ))
     }
-    return segment_colors.get(segment, '#95A5A6')
 
+@st.cache_data(show_spinner=False, hash_funcs=SOURCE_FRAME_HASH)
+def get_urgent(df):
+    """Top categories by Business Priority (not just priority level 1-3)"""
+    return priority_sorted(df).iloc[:10]
+
+@st.cache_data(show_spinner=False, hash_funcs=SOURCE_FRAME_HASH)
+def get_high_severity(df):
+    """Categories with a Quality Severity of 25 or more"""
+    return df.loc[df['Quality Severity (0-100)'].to_numpy() >= 25]
+
+@st.cache_data(show_spinner=False, hash_funcs=SOURCE_FRAME_HASH)
+def get_very_high_demand(df):
+    """Categories in the Very High demand tier, highest Business Priority first"""
+    ranked = priority_sorted(df)
+    return ranked.loc[(ranked['Demand Level'] == 'Very High').to_numpy()]
+
+@st.cache_data(show_spinner=False, hash_funcs=SOURCE_FRAME_HASH)
+def get_quality_gaps(df):
+    """Categories below the ecosystem median, with their summary aggregates"""
+    quality_gap_df = df.loc[df['Quality vs Median'].to_numpy() < 0]
+    return {
+        'quality_gap_df': quality_gap_df,
+        'total_affected': quality_gap_df['Est. Merchants Affected'].sum(),
+        'avg_gap': quality_gap_df['Quality vs Median'].mean(),
+        'affected_df': quality_gap_df.nlargest(15, 'Est. Merchants Affected')
+    }
+
+# Columns shown in the Complete Category Analysis table, in display order
+COMPLETE_TABLE_COLUMNS = (
+    'Feature Category', 'Strategic Segment', 'Demand Level',
+    'Quality Severity (0-100)', 'Merchant Impact (0-100)', 'Business Priority (0-100)',
+    'Priority Level (1-5)', 'Action Timeline', 'Current Avg Rating',
+    'Reviews Per App', 'Est. Merchants Affected', 'Predicted Churn %',
+    'Quality vs Median', '% Apps with 4.5+ Stars',
+    'Statistically Significant?'
+)
+
+# Larger analyses show only the top rows by priority; the CSV download stays complete
+COMPLETE_TABLE_PAGE_ROWS = 100
+
+@st.cache_data(show_spinner=False, hash_funcs=SOURCE_FRAME_HASH)
+def build_complete_table(df):
+    """Complete category table sorted by Business Priority"""
+    # Only include columns that actually exist in the dataframe
+    display_cols = [col for col in COMPLETE_TABLE_COLUMNS if col in df.columns]
+    return priority_sorted(df)[display_cols]
+
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df):
+    """Serialize a frame for st.download_button"""
+    return df.to_csv(index=False).encode('utf-8')
+
+@fragment
 def render_segment_detail(df, segment):
     """Render detailed view for a specific segment"""
     # Back button at the top
@@ -125,9 +773,9 @@ def render_segment_detail(df, segment):
     
     st.markdown(f"### 🔍 Deep Dive: {segment}")
     
-    segment_df = df[df['Strategic Segment'] == segment].copy()
+    segment_df = segments_index(df).get(segment)
     
-    if len(segment_df) == 0:
+    if segment_df is None or len(segment_df) == 0:
         st.warning(f"No categories found in {segment}")
         return
     
@@ -136,19 +784,17 @@ def render_segment_detail(df, segment):
     action_col = "What Should Shopify Do?"
     
     # Overview metrics
+    agg = segment_aggregates(df)[segment]
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Categories", len(segment_df))
+        st.metric("Categories", agg['n'])
     with col2:
-        avg_quality_sev = segment_df['Quality Severity (0-100)'].mean()
-        st.metric("Avg Quality Severity", f"{avg_quality_sev:.0f}/100")
+        st.metric("Avg Quality Severity", f"{agg['avg_quality']:.0f}/100")
     with col3:
-        avg_merchant_impact = segment_df['Merchant Impact (0-100)'].mean()
-        st.metric("Avg Merchant Impact", f"{avg_merchant_impact:.0f}/100")
+        st.metric("Avg Merchant Impact", f"{agg['avg_impact']:.0f}/100")
     with col4:
-        total_affected = segment_df['Est. Merchants Affected'].sum()
-        st.metric("Total Merchants Affected", f"~{int(total_affected/1000)}K")
+        st.metric("Total Merchants Affected", f"~{int(agg['total_affected']/1000)}K")
     
     st.markdown("---")
     
@@ -159,35 +805,10 @@ def render_segment_detail(df, segment):
     segment_color = get_segment_color(segment)
     
     # Check if this segment has quality issues (non-zero quality severity)
-    has_quality_issues = (segment_df['Quality Severity (0-100)'] > 0).any()
+    has_quality_issues = agg['has_issues']
     
     if has_quality_issues:
-        fig_scatter = px.scatter(
-            segment_df,
-            x='Merchant Impact (0-100)',
-            y='Quality Severity (0-100)',
-            size='Business Priority (0-100)',
-            hover_name='Feature Category',
-            text='Feature Category',
-            hover_data={
-                'Current Avg Rating': ':.2f',
-                'Quality vs Median': ':.3f',
-                '# of Apps': True,
-                'Est. Merchants Affected': ':,',
-                'Predicted Churn %': ':.1f',
-                'Feature Category': False
-            },
-            title=f"Categories in {segment}"
-        )
-        
-        # Apply segment color to all bubbles
-        fig_scatter.update_traces(
-            marker=dict(color=segment_color),
-            textposition='top center',
-            textfont_size=9
-        )
-        
-        fig_scatter.update_layout(height=500)
+        fig_scatter = build_segment_scatter(segment_df, segment, segment_color)
         st.plotly_chart(fig_scatter, use_container_width=True)
         
         st.markdown("""
@@ -209,13 +830,7 @@ def render_segment_detail(df, segment):
         </div>
         """, unsafe_allow_html=True)
         
-        performance_df = segment_df[[
-            'Feature Category', 
-            'Current Avg Rating',
-            '# of Apps',
-            'Est. Merchants Affected',
-            '% Apps with 4.5+ Stars'
-        ]].sort_values('Est. Merchants Affected', ascending=False)
+        performance_df = build_segment_performance_table(segment_df)
         
         st.dataframe(performance_df, use_container_width=True, height=300)
     
@@ -224,36 +839,54 @@ def render_segment_detail(df, segment):
     # Category list with actions
     st.markdown("#### 📝 Strategic Actions by Category")
     
-    for idx, row in segment_df.iterrows():
-        with st.expander(f"**{row['Feature Category']}** - Priority {row['Priority Level (1-5)']} ({row['Action Timeline']})"):
+    # Project onto attribute-friendly names so the loop can use itertuples;
+    # reindex leaves missing text columns as NaN, which the notna checks skip
+    action_rows = segment_df.reindex(columns=[
+        'Feature Category', 'Priority Level (1-5)', 'Action Timeline',
+        '_rating_str', '_gap_str', '_affected_k',
+        '_churn_str', 'Quality Severity (0-100)', 'Merchant Impact (0-100)',
+        'Business Priority (0-100)', problem_col, action_col
+    ]).set_axis([
+        'category', 'priority_level', 'timeline',
+        'rating', 'quality_gap', 'merchants_affected',
+        'churn', 'quality_severity', 'merchant_impact',
+        'business_priority', 'problem', 'action'
+    ], axis=1)
+    
+    for r in action_rows.itertuples(index=False):
+        with st.expander(f"**{r.category}** - Priority {r.priority_level} ({r.timeline})"):
             col1, col2 = st.columns(2)
             
+            # One markdown element per block instead of one per line
             with col1:
-                st.markdown(f"**📊 Key Metrics:**")
-                st.markdown(f"- Current Rating: {row['Current Avg Rating']:.2f}★")
-                st.markdown(f"- Quality Gap: {row['Quality vs Median']:.3f}★")
-                st.markdown(f"- Merchants Affected: ~{int(row['Est. Merchants Affected']/1000)}K")
-                st.markdown(f"- Predicted Churn: {row['Predicted Churn %']:.1f}%")
+                st.markdown(
+                    f"**📊 Key Metrics:**\n\n"
+                    f"- Current Rating: {r.rating}\n"
+                    f"- Quality Gap: {r.quality_gap}\n"
+                    f"- Merchants Affected: {r.merchants_affected}\n"
+                    f"- Predicted Churn: {r.churn}"
+                )
             
             with col2:
-                st.markdown(f"**🎯 Scores:**")
-                st.markdown(f"- Quality Severity: {row['Quality Severity (0-100)']:.0f}/100")
-                st.markdown(f"- Merchant Impact: {row['Merchant Impact (0-100)']:.0f}/100")
-                st.markdown(f"- Business Priority: {row['Business Priority (0-100)']:.0f}/100")
+                st.markdown(
+                    f"**🎯 Scores:**\n\n"
+                    f"- Quality Severity: {r.quality_severity:.0f}/100\n"
+                    f"- Merchant Impact: {r.merchant_impact:.0f}/100\n"
+                    f"- Business Priority: {r.business_priority:.0f}/100"
+                )
             
-            if problem_col in row and pd.notna(row[problem_col]):
-                st.markdown(f"**❓ What's the Problem?**")
-                st.markdown(row[problem_col])
+            if pd.notna(r.problem):
+                st.markdown(f"**❓ What's the Problem?**\n\n{r.problem}")
             
-            if action_col in row and pd.notna(row[action_col]):
-                st.markdown(f"**💡 Recommended Action:**")
-                st.markdown(row[action_col])
+            if pd.notna(r.action):
+                st.markdown(f"**💡 Recommended Action:**\n\n{r.action}")
     
     # Back button
     if st.button("← Back to Overview", key='back_from_segment'):
         st.session_state.current_view = 'main'
         st.rerun()
 
+@fragment
 def render_category_detail(df, category):
     """Render detailed view for a specific category"""
     # Back button at the top
@@ -264,19 +897,19 @@ def render_category_detail(df, category):
     
     st.markdown(f"### 🔍 Deep Dive: {category}")
     
-    cat_data = df[df['Feature Category'] == category].iloc[0]
+    cat_data = categories_index(df)[category]
     
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Current Rating", f"{cat_data['Current Avg Rating']:.2f}★")
+        st.metric("Current Rating", cat_data['_rating_str'])
     with col2:
-        st.metric("Quality Gap", f"{cat_data['Quality vs Median']:.3f}★")
+        st.metric("Quality Gap", cat_data['_gap_str'])
     with col3:
-        st.metric("Merchants Affected", f"~{int(cat_data['Est. Merchants Affected']/1000)}K")
+        st.metric("Merchants Affected", cat_data['_affected_k'])
     with col4:
-        st.metric("Predicted Churn", f"{cat_data['Predicted Churn %']:.1f}%")
+        st.metric("Predicted Churn", cat_data['_churn_str'])
     
     st.markdown("---")
     
@@ -340,16 +973,266 @@ def render_category_detail(df, category):
         st.session_state.current_view = 'main'
         st.rerun()
 
+@fragment
+def render_urgent_drilldown(df):
+    """Render the Actionable Priority Categories drill-down"""
+    urgent_df = get_urgent(df)
+    
+    st.markdown("---")
+    st.markdown("### 🚨 Categories Needing Immediate Action")
+    
+    st.markdown("""
+    <div class="metric-explanation">
+    <b>📖 Why Immediate Action?</b> These categories have the highest Business Priority scores, 
+    combining both quality problems and merchant impact. Higher scores mean fixing these issues 
+    will improve merchant success the most.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Action cards, sent as a single element
+    st.markdown(build_urgent_cards_html(urgent_df), unsafe_allow_html=True)
+    
+    if DATAFRAME_SELECTION:
+        st.markdown("**🔍 Select a row to view full details:**")
+        selection = st.dataframe(
+            urgent_df[['Feature Category', 'Business Priority (0-100)',
+                       'Quality Severity (0-100)', 'Merchant Impact (0-100)']],
+            column_config={
+                col: st.column_config.ProgressColumn(col, min_value=0, max_value=100, format="%d")
+                for col in ('Business Priority (0-100)', 'Quality Severity (0-100)', 'Merchant Impact (0-100)')
+            },
+            hide_index=True,
+            use_container_width=True,
+            selection_mode='single-row',
+            on_select='rerun',
+            key='urgent_table'
+        )
+        if selection.selection.rows:
+            st.session_state.current_view = 'category_detail'
+            st.session_state.selected_category = urgent_df['Feature Category'].iat[selection.selection.rows[0]]
+            st.rerun()
+    else:
+        detail_cat = st.selectbox(
+            "Select a category to view full details:",
+            urgent_df['Feature Category'].tolist(),
+            key='urgent_detail_selector'
+        )
+        if st.button("🔍 View Full Details", key='urgent_detail_btn'):
+            st.session_state.current_view = 'category_detail'
+            st.session_state.selected_category = detail_cat
+            st.rerun()
+    
+    # Visualization
+    st.markdown("---")
+    st.markdown("### 📊 Business Priority Breakdown")
+    
+    fig_urgent = build_urgent_chart(urgent_df)
+    st.plotly_chart(fig_urgent, use_container_width=True)
+
+@fragment
+def render_severity_drilldown(df):
+    """Render the Quality Severity Issues drill-down"""
+    high_severity = get_high_severity(df)
+    
+    st.markdown("---")
+    st.markdown("### 🔥 Quality Severity Issues")
+    
+    st.markdown("""
+    <div class="metric-explanation">
+    <b>📖 Quality Severity Score:</b> Higher scores indicate more significant quality problems with apps 
+    in this category, considering the size of the quality gap, percentage of low-rated apps, and 
+    lack of high-quality alternatives.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    severity_df = high_severity.sort_values('Quality Severity (0-100)', ascending=False)
+    
+    # Scatter: Severity vs Impact
+    fig_sev = build_severity_scatter(severity_df)
+    st.plotly_chart(fig_sev, use_container_width=True)
+    
+    st.markdown("""
+    <div class="metric-explanation">
+    <b>💡 Quadrant Analysis:</b><br>
+    • <b>Top-right:</b> Severe quality problems affecting many merchants (URGENT)<br>
+    • <b>Top-left:</b> Severe quality but low merchant reach (monitor for demand growth)<br>
+    • <b>Bubble size:</b> Business Priority (bigger = higher overall priority)
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Top categories
+    st.markdown("---")
+    st.markdown("#### 📋 All Quality Severity Issues")
+    
+    display_df = severity_df[['Feature Category', 'Quality Severity (0-100)', 'Merchant Impact (0-100)',
+                               'Business Priority (0-100)', 'Current Avg Rating', 
+                              'Quality vs Median', 'Demand Level']]
+    
+    st.dataframe(display_df, use_container_width=True, height=500)
+
+@fragment
+def render_demand_drilldown(df):
+    """Render the Very High Demand Categories drill-down"""
+    vh_df = get_very_high_demand(df)
+    
+    st.markdown("---")
+    st.markdown("### 📊 Very High Demand Categories: Revenue & Growth Opportunities")
+    
+    st.markdown("""
+    <div class="metric-explanation">
+    <b>📖 High-Value Categories:</b>
+    These are the most heavily-used app categories by Shopify merchants, representing the highest 
+    revenue potential and strategic importance. Success in these categories drives significant 
+    merchant retention and platform growth.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Market size is optional in the source data; fall back to merchants affected
+    has_market_size = 'Total Reviews (Market Size)' in vh_df.columns
+    market_col = 'Total Reviews (Market Size)' if has_market_size else 'Est. Merchants Affected'
+    
+    # Summary metrics focused on opportunity
+    col_vh1, col_vh2, col_vh3, col_vh4 = st.columns(4)
+    
+    with col_vh1:
+        st.metric("High-Demand Categories", len(vh_df))
+    with col_vh2:
+        total_reviews_vh = vh_df['Total Reviews (Market Size)'].sum() if has_market_size else 0
+        st.metric("Total Market Size", f"~{int(total_reviews_vh/1000)}K reviews")
+    with col_vh3:
+        avg_rating = vh_df['Current Avg Rating'].mean()
+        st.metric("Average Quality", f"{avg_rating:.2f}★")
+    with col_vh4:
+        total_merchants_vh = vh_df['Est. Merchants Affected'].sum()
+        st.metric("Active Merchants", f"~{int(total_merchants_vh/1000)}K")
+    
+    st.markdown("---")
+    
+    # Strategic insights
+    st.markdown("### 💡 Strategic Insights for Merchant Success")
+    
+    col_insight1, col_insight2 = st.columns(2)
+    
+    with col_insight1:
+        st.markdown("""
+        <div class="info-box">
+        <b>🎯 Revenue Drivers:</b><br>
+        • High merchant adoption = Higher platform revenue<br>
+        • Categories with most merchant activity<br>
+        • Prime candidates for premium features<br>
+        • Investment here has highest ROI
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_insight2:
+        st.markdown("""
+        <div class="info-box">
+        <b>📈 Growth Strategies:</b><br>
+        • Focus developer resources on these categories<br>
+        • Prioritize API improvements and documentation<br>
+        • Enhance app discovery and recommendations<br>
+        • Monitor for emerging quality issues early
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Category comparison by market size and quality
+    st.markdown("### 📊 Market Opportunity by Category")
+    
+    fig_vh_comparison = build_demand_chart(vh_df, market_col)
+    st.plotly_chart(fig_vh_comparison, use_container_width=True)
+    
+    st.markdown("""
+    <div class="metric-explanation">
+    <b>💡 Color coding:</b> Green = Higher merchant impact, Yellow = Moderate impact, Red = Lower merchant impact
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Full table
+    st.markdown("#### 📋 All Very High Demand Categories")
+    
+    display_vh = vh_df[
+        [
+            'Feature Category',
+            'Strategic Segment',
+            'Current Avg Rating',
+            market_col,
+            'Est. Merchants Affected',
+            '# of Apps'
+        ]
+    ]
+    
+    st.dataframe(display_vh, use_container_width=True, height=500)
+
+@fragment
+def render_affected_drilldown(df):
+    """Render the Merchants Affected by Quality Gaps drill-down"""
+    gaps = get_quality_gaps(df)
+    quality_gap_df = gaps['quality_gap_df']
+    total_affected = gaps['total_affected']
+    
+    st.markdown("---")
+    st.markdown("### 👥 Merchants Affected by Quality Gaps")
+    
+    st.markdown("""
+    <div class="metric-explanation">
+    <b>📖 Understanding Merchant Impact:</b> This shows categories where quality falls below the ecosystem 
+    median, and estimates how many merchants are experiencing subpar app quality. Larger numbers indicate 
+    more widespread quality issues affecting merchant success.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    affected_df = gaps['affected_df']
+    
+    # Summary metrics
+    col_aff1, col_aff2, col_aff3 = st.columns(3)
+    
+    with col_aff1:
+        st.metric("Total Categories with Quality Gaps", len(quality_gap_df))
+    with col_aff2:
+        st.metric("Total Merchants Affected", f"~{int(total_affected/1000)}K")
+    with col_aff3:
+        st.metric("Average Quality Gap", f"{gaps['avg_gap']:.3f}★")
+    
+    st.markdown("---")
+    
+    # Bar chart
+    fig_affected = build_affected_chart(affected_df)
+    st.plotly_chart(fig_affected, use_container_width=True)
+    
+    st.markdown("""
+    <div class="metric-explanation">
+    <b>💡 Color coding:</b> Darker red = Higher business priority for intervention
+    </div>
+    """, unsafe_allow_html=True)
+
+@fragment
+def render_priority_selector(priority_categories):
+    """Render the Priority Analysis category selector and its navigation button"""
+    # Changing the selection only reruns this fragment, not the charts above it
+    selected_cat = st.selectbox(
+        "Select a category to view full analysis:",
+        priority_categories,
+        key='combined_cat_selector'
+    )
+    
+    if st.button("View Full Analysis", key='view_combined'):
+        st.session_state.current_view = 'category_detail'
+        st.session_state.selected_category = selected_cat
+        st.rerun()
+
 # ============================================================================
 # MAIN APP
 # ============================================================================
 
 # Header
-st.markdown('<h1 class="main-header">🎯 Shopify App Store Product Strategy Dashboard</h1>', unsafe_allow_html=True)
-st.markdown('<p class="sub-header">Uncovering Quality Gaps and Merchant Pain Points to Prioritize Platform Improvements</p>', unsafe_allow_html=True)
+st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 # Load data
-df_q1 = load_query1_data()
+df_q1 = load_query1_data(QUERY1_CSV, os.path.getmtime(QUERY1_CSV))
 
 # ============================================================================
 # HANDLE DIFFERENT VIEWS
@@ -362,7 +1245,12 @@ elif st.session_state.current_view == 'category_detail':
     render_category_detail(df_q1, st.session_state.selected_category)
 
 else:
-    # Main dashboard view
+    # Main dashboard view. Figures come from the cached build_* helpers, which
+    # import Plotly themselves, so cache hits skip figure construction entirely
+    
+    # Filters and counts shared by all three tabs, computed once per data load
+    overview = compute_overview_metrics(df_q1)
+    
     tabs = st.tabs(["📊 Strategic Overview", "🎯 Priority Analysis", "📈 Performance Insights"])
     
     # ========================================================================
@@ -371,392 +1259,36 @@ else:
     with tabs[0]:
         st.markdown("### 🎯 Key Insights at a Glance")
         
-        # Hero metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
         # Calculate metrics
-        # Get top categories by Business Priority (not just priority level 1-3)
-        urgent_and_high = df_q1.nlargest(10, 'Business Priority (0-100)')
-        high_severity = df_q1[df_q1['Quality Severity (0-100)'] >= 25]
-        
-        urgent_count = len(urgent_and_high)
-        high_severity_count = len(high_severity)
-        
-        very_high_demand = df_q1[df_q1['Demand Level'] == 'Very High']
-        very_high_count = len(very_high_demand)
-        
-        quality_gap_df = df_q1[df_q1['Quality vs Median'] < 0]
-        total_affected = quality_gap_df['Est. Merchants Affected'].sum()
+        urgent_count = overview['urgent_count']
+        high_severity_count = overview['high_severity_count']
+        very_high_count = overview['very_high_count']
+        total_affected = overview['total_affected']
         
-        with col1:
-            st.markdown(f"""
-            <div style='text-align: center; padding: 2rem; background: linear-gradient(135deg, #E74C3C 0%, #C0392B 100%); 
-                        border-radius: 10px; color: white; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
-                <h1 style='color: white; margin: 0; font-size: 3rem;'>{urgent_count}</h1>
-                <p style='margin: 0.5rem 0 0 0; font-size: 1.1rem; font-weight: 600;'>Actionable<br>Priority Categories</p>
-            </div>
-            """, unsafe_allow_html=True)
-            if st.button("View Details", use_container_width=True, key='hero1'):
-                st.session_state.clicked_metric_tab1 = 'urgent'
-        
-        with col2:
-            st.markdown(f"""
-            <div style='text-align: center; padding: 2rem; background: linear-gradient(135deg, #E67E22 0%, #D35400 100%); 
-                        border-radius: 10px; color: white; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
-                <h1 style='color: white; margin: 0; font-size: 3rem;'>{high_severity_count}</h1>
-                <p style='margin: 0.5rem 0 0 0; font-size: 1.1rem; font-weight: 600;'>Quality Severity<br>Issues</p>
-            </div>
-            """, unsafe_allow_html=True)
-            if st.button("View Details", use_container_width=True, key='hero2'):
-                st.session_state.clicked_metric_tab1 = 'severity'
+        hero_values = (urgent_count, high_severity_count, very_high_count, f"~{int(total_affected/1000)}K")
         
-        with col3:
-            st.markdown(f"""
-            <div style='text-align: center; padding: 2rem; background: linear-gradient(135deg, #3498DB 0%, #2980B9 100%); 
-                        border-radius: 10px; color: white; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
-                <h1 style='color: white; margin: 0; font-size: 3rem;'>{very_high_count}</h1>
-                <p style='margin: 0.5rem 0 0 0; font-size: 1.1rem; font-weight: 600;'>Very High Demand<br>Categories</p>
-            </div>
-            """, unsafe_allow_html=True)
-            if st.button("View Details", use_container_width=True, key='hero3'):
-                st.session_state.clicked_metric_tab1 = 'demand'
-        
-        with col4:
-            st.markdown(f"""
-            <div style='text-align: center; padding: 2rem; background: linear-gradient(135deg, #9B59B6 0%, #8E44AD 100%); 
-                        border-radius: 10px; color: white; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
-                <h1 style='color: white; margin: 0; font-size: 3rem;'>~{int(total_affected/1000)}K</h1>
-                <p style='margin: 0.5rem 0 0 0; font-size: 1.1rem; font-weight: 600;'>Merchants Affected<br>by Quality Gaps</p>
-            </div>
-            """, unsafe_allow_html=True)
-            if st.button("View Details", use_container_width=True, key='hero4'):
-                st.session_state.clicked_metric_tab1 = 'affected'
+        # Hero metrics
+        for col, (key, metric, color_from, color_to, label), value in zip(st.columns(4), HERO_CARDS, hero_values):
+            with col:
+                st.markdown(HERO_CARD_TEMPLATE.format(
+                    color_from=color_from, color_to=color_to, value=value, label=label
+                ), unsafe_allow_html=True)
+                if st.button("View Details", use_container_width=True, key=key):
+                    st.session_state.clicked_metric_tab1 = metric
         
         # ========================================================================
         # HERO METRIC DRILL-DOWNS
         # ========================================================================
         
+        # Each drill-down is a fragment, so widgets inside it only rerun that block
         if st.session_state.clicked_metric_tab1 == 'urgent':
-            st.markdown("---")
-            st.markdown("### 🚨 Categories Needing Immediate Action")
-            
-            st.markdown("""
-            <div class="metric-explanation">
-            <b>📖 Why Immediate Action?</b> These categories have the highest Business Priority scores, 
-            combining both quality problems and merchant impact. Higher scores mean fixing these issues 
-            will improve merchant success the most.
-            </div>
-            """, unsafe_allow_html=True)
-            
-            urgent_df = urgent_and_high.sort_values('Business Priority (0-100)', ascending=False)
-            
-            # Action cards
-            for idx, row in urgent_df.iterrows():
-                border_color = "#C0392B" if row['Priority Level (1-5)'] == 1 else "#E67E22" if row['Priority Level (1-5)'] == 2 else "#F39C12"
-                priority_emoji = "🔴" if row['Priority Level (1-5)'] == 1 else "🟠" if row['Priority Level (1-5)'] == 2 else "🟡"
-                
-                st.markdown(f"""
-                <div style="padding: 1.2rem; border-radius: 10px; border-left: 5px solid {border_color}; 
-                            background: white; margin-bottom: 1rem; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-                    <h4 style="margin: 0 0 0.5rem 0; color: {border_color};">
-                        {priority_emoji} {row['Feature Category']} - Business Priority: {int(row['Business Priority (0-100)'])}/100
-                    </h4>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                col_a, col_b, col_c = st.columns(3)
-                
-                with col_a:
-                    st.metric("Quality Severity", f"{int(row['Quality Severity (0-100)'])}/100")
-                    st.metric("Current Rating", f"{row['Current Avg Rating']:.2f}★")
-                
-                with col_b:
-                    st.metric("Merchant Impact", f"{int(row['Merchant Impact (0-100)'])}/100")
-                    st.metric("Merchants Affected", f"~{int(row['Est. Merchants Affected']):,}")
-                
-                with col_c:
-                    st.metric("Demand Level", row['Demand Level'])
-                    st.metric("Predicted Churn", f"{row['Predicted Churn %']:.1f}%")
-                
-                if st.button(f"🔍 View Full Details: {row['Feature Category']}", key=f"detail_{idx}"):
-                    st.session_state.current_view = 'category_detail'
-                    st.session_state.selected_category = row['Feature Category']
-                    st.rerun()
-            
-            # Visualization
-            st.markdown("---")
-            st.markdown("### 📊 Business Priority Breakdown")
-            
-            fig_urgent = go.Figure()
-            
-            # Use a gradient color scale based on priority level
-            colors = urgent_df['Business Priority (0-100)'].apply(
-                lambda x: f'rgb({int(192 - (x/100)*130)}, {int(57 + (x/100)*130)}, {int(43)})'
-            )
-            
-            fig_urgent.add_trace(go.Bar(
-                y=urgent_df['Feature Category'],
-                x=urgent_df['Business Priority (0-100)'],
-                orientation='h',
-                marker=dict(
-                    color=colors,
-                    line=dict(color='white', width=1)
-                ),
-                text=urgent_df['Business Priority (0-100)'].astype(int),
-                textposition='outside',
-                hovertemplate='<b>%{y}</b><br>' +
-                             'Business Priority: %{x}/100<br>' +
-                             'Quality Severity: %{customdata[0]}/100<br>' +
-                             'Merchant Impact: %{customdata[1]}/100<br>' +
-                             '<extra></extra>',
-                customdata=urgent_df[['Quality Severity (0-100)', 'Merchant Impact (0-100)']].values
-            ))
-            
-            fig_urgent.update_layout(
-                height=max(400, len(urgent_df) * 50),
-                xaxis_title="Business Priority Score (0-100)",
-                yaxis_title="",
-                yaxis={'categoryorder': 'total ascending'},
-                showlegend=False
-            )
-            
-            st.plotly_chart(fig_urgent, use_container_width=True)
-            
-          
+            render_urgent_drilldown(df_q1)
         elif st.session_state.clicked_metric_tab1 == 'severity':
-            st.markdown("---")
-            st.markdown("### 🔥 Quality Severity Issues")
-            
-            st.markdown("""
-            <div class="metric-explanation">
-            <b>📖 Quality Severity Score:</b> Higher scores indicate more significant quality problems with apps 
-            in this category, considering the size of the quality gap, percentage of low-rated apps, and 
-            lack of high-quality alternatives.
-            </div>
-            """, unsafe_allow_html=True)
-            
-            severity_df = high_severity.sort_values('Quality Severity (0-100)', ascending=False)
-            
-            # Scatter: Severity vs Impact
-            fig_sev = px.scatter(
-                severity_df,
-                x='Merchant Impact (0-100)',
-                y='Quality Severity (0-100)',
-                size='Business Priority (0-100)',
-                color='Business Priority (0-100)',
-                hover_name='Feature Category',
-                text='Feature Category',
-                hover_data={
-                    'Current Avg Rating': ':.2f',
-                    'Quality vs Median': ':.3f',
-                    'Est. Merchants Affected': ':,',
-                    'Predicted Churn %': ':.1f',
-                    'Feature Category': False
-                },
-                color_continuous_scale='Reds',
-                title="App Quality Issues by Category: Quality Severity vs Merchant Impact"
-            )
-            
-            # Update text position to avoid overlap
-            fig_sev.update_traces(
-                textposition='top center',
-                textfont_size=9
-            )
-            
-            fig_sev.update_layout(height=600)
-            st.plotly_chart(fig_sev, use_container_width=True)
-            
-            st.markdown("""
-            <div class="metric-explanation">
-            <b>💡 Quadrant Analysis:</b><br>
-            • <b>Top-right:</b> Severe quality problems affecting many merchants (URGENT)<br>
-            • <b>Top-left:</b> Severe quality but low merchant reach (monitor for demand growth)<br>
-            • <b>Bubble size:</b> Business Priority (bigger = higher overall priority)
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Top categories
-            st.markdown("---")
-            st.markdown("#### 📋 All Quality Severity Issues")
-            
-            display_df = severity_df[['Feature Category', 'Quality Severity (0-100)', 'Merchant Impact (0-100)',
-                                       'Business Priority (0-100)', 'Current Avg Rating', 
-                                      'Quality vs Median', 'Demand Level']].copy()
-            
-            st.dataframe(display_df, use_container_width=True, height=500)
-        
+            render_severity_drilldown(df_q1)
         elif st.session_state.clicked_metric_tab1 == 'demand':
-            st.markdown("---")
-            st.markdown("### 📊 Very High Demand Categories: Revenue & Growth Opportunities")
-            
-            st.markdown("""
-            <div class="metric-explanation">
-            <b>📖 High-Value Categories:</b>
-            These are the most heavily-used app categories by Shopify merchants, representing the highest 
-            revenue potential and strategic importance. Success in these categories drives significant 
-            merchant retention and platform growth.
-            </div>
-            """, unsafe_allow_html=True)
-            
-            vh_df = very_high_demand.sort_values('Business Priority (0-100)', ascending=False)
-            
-            # Summary metrics focused on opportunity
-            col_vh1, col_vh2, col_vh3, col_vh4 = st.columns(4)
-            
-            with col_vh1:
-                st.metric("High-Demand Categories", len(vh_df))
-            with col_vh2:
-                total_reviews_vh = vh_df['Total Reviews (Market Size)'].sum() if 'Total Reviews (Market Size)' in vh_df.columns else 0
-                st.metric("Total Market Size", f"~{int(total_reviews_vh/1000)}K reviews")
-            with col_vh3:
-                avg_rating = vh_df['Current Avg Rating'].mean()
-                st.metric("Average Quality", f"{avg_rating:.2f}★")
-            with col_vh4:
-                total_merchants_vh = vh_df['Est. Merchants Affected'].sum()
-                st.metric("Active Merchants", f"~{int(total_merchants_vh/1000)}K")
-            
-            st.markdown("---")
-            
-            # Strategic insights
-            st.markdown("### 💡 Strategic Insights for Merchant Success")
-            
-            col_insight1, col_insight2 = st.columns(2)
-            
-            with col_insight1:
-                st.markdown("""
-                <div class="info-box">
-                <b>🎯 Revenue Drivers:</b><br>
-                • High merchant adoption = Higher platform revenue<br>
-                • Categories with most merchant activity<br>
-                • Prime candidates for premium features<br>
-                • Investment here has highest ROI
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col_insight2:
-                st.markdown("""
-                <div class="info-box">
-                <b>📈 Growth Strategies:</b><br>
-                • Focus developer resources on these categories<br>
-                • Prioritize API improvements and documentation<br>
-                • Enhance app discovery and recommendations<br>
-                • Monitor for emerging quality issues early
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("---")
-            
-            # Category comparison by market size and quality
-            st.markdown("### 📊 Market Opportunity by Category")
-            
-            fig_vh_comparison = px.bar(
-                vh_df.sort_values('Total Reviews (Market Size)', ascending=True) if 'Total Reviews (Market Size)' in vh_df.columns else vh_df,
-                y='Feature Category',
-                x='Total Reviews (Market Size)' if 'Total Reviews (Market Size)' in vh_df.columns else 'Est. Merchants Affected',
-                orientation='h',
-                color='Est. Merchants Affected',
-                color_continuous_scale='RdYlGn',
-                hover_data={
-                    'Current Avg Rating': ':.2f',
-                    'Business Priority (0-100)': True,
-                    'Est. Merchants Affected': ':,',
-                    '# of Apps': True
-                },
-                title="High-Demand Categories by Market Size & Merchant Impact",
-                labels={
-                    'Total Reviews (Market Size)': 'Market Size (Reviews)',
-                    'Est. Merchants Affected': 'Merchants Affected'
-                }
-            )
-            
-            fig_vh_comparison.update_layout(height=600)
-            st.plotly_chart(fig_vh_comparison, use_container_width=True)
-            
-            st.markdown("""
-            <div class="metric-explanation">
-            <b>💡 Color coding:</b> Green = Higher merchant impact, Yellow = Moderate impact, Red = Lower merchant impact
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown("---")
-            
-            # Full table
-            st.markdown("#### 📋 All Very High Demand Categories")
-            
-            display_vh = vh_df[
-                [
-                    'Feature Category',
-                    'Strategic Segment',
-                    'Current Avg Rating',
-                    'Total Reviews (Market Size)' if 'Total Reviews (Market Size)' in vh_df.columns else 'Est. Merchants Affected',
-                    'Est. Merchants Affected',
-                    '# of Apps'
-                ]
-            ].copy()
-            
-            st.dataframe(display_vh, use_container_width=True, height=500)
-        
+            render_demand_drilldown(df_q1)
         elif st.session_state.clicked_metric_tab1 == 'affected':
-            st.markdown("---")
-            st.markdown("### 👥 Merchants Affected by Quality Gaps")
-            
-            st.markdown("""
-            <div class="metric-explanation">
-            <b>📖 Understanding Merchant Impact:</b> This shows categories where quality falls below the ecosystem 
-            median, and estimates how many merchants are experiencing subpar app quality. Larger numbers indicate 
-            more widespread quality issues affecting merchant success.
-            </div>
-            """, unsafe_allow_html=True)
-            
-            affected_df = quality_gap_df.sort_values(
-                'Est. Merchants Affected', ascending=False
-            ).head(15)
-            
-            # Summary metrics
-            col_aff1, col_aff2, col_aff3 = st.columns(3)
-            
-            with col_aff1:
-                st.metric("Total Categories with Quality Gaps", len(quality_gap_df))
-            with col_aff2:
-                st.metric("Total Merchants Affected", f"~{int(total_affected/1000)}K")
-            with col_aff3:
-                avg_gap = quality_gap_df['Quality vs Median'].mean()
-                st.metric("Average Quality Gap", f"{avg_gap:.3f}★")
-            
-            st.markdown("---")
-            
-            # Bar chart
-            fig_affected = px.bar(
-                affected_df,
-                y='Feature Category',
-                x='Est. Merchants Affected',
-                orientation='h',
-                color='Business Priority (0-100)',
-                color_continuous_scale='Reds',
-                hover_data={
-                    'Quality Severity (0-100)': True,
-                    'Merchant Impact (0-100)': True,
-                    'Current Avg Rating': ':.2f',
-                    'Quality vs Median': ':.3f',
-                    'Demand Level': True
-                },
-                title="Top 15 Categories by Merchants Affected"
-            )
-            
-            fig_affected.update_layout(
-                height=600,
-                xaxis_title="Estimated Merchants Affected",
-                yaxis_title="",
-                yaxis={'categoryorder': 'total ascending'}
-            )
-            
-            st.plotly_chart(fig_affected, use_container_width=True)
-            
-            st.markdown("""
-            <div class="metric-explanation">
-            <b>💡 Color coding:</b> Darker red = Higher business priority for intervention
-            </div>
-            """, unsafe_allow_html=True)
+            render_affected_drilldown(df_q1)
         
         st.markdown("---")
         
@@ -770,90 +1302,22 @@ else:
         with col_pie:
             st.markdown("#### Category Distribution by Segment")
             
-            # Get segment counts and combine similar categories
-            segment_counts_raw = df_q1['Strategic Segment'].value_counts()
-            
-            # Combine Meeting Expectations and High Demand Good Quality
-            combined_counts = {}
-            for segment, count in segment_counts_raw.items():
-                if segment in ['Meeting Expectations', 'High Demand, Good Quality']:
-                    combined_counts['High Demand, Good Quality'] = combined_counts.get('High Demand, Good Quality', 0) + count
-                else:
-                    combined_counts[segment] = count
-            
-            segment_counts = pd.Series(combined_counts)
+            # Segment counts with similar categories combined
+            segment_counts = overview['segment_counts']
             
-            # Create improved color mapping
-            segment_color_map = {}
-            for segment in segment_counts.index:
-                segment_color_map[segment] = get_segment_color(segment)
-            
-            # Create pie chart with better formatting
-            fig_pie = go.Figure(data=[go.Pie(
-                labels=segment_counts.index,
-                values=segment_counts.values,
-                hole=0.4,
-                marker=dict(colors=[segment_color_map[seg] for seg in segment_counts.index]),
-                textposition='outside',
-                textinfo='label+percent',
-                textfont=dict(size=12),
-                hovertemplate='<b>%{label}</b><br>Categories: %{value}<br>Percentage: %{percent}<extra></extra>'
-            )])
-            
-            fig_pie.update_layout(
-                showlegend=True,
-                height=450,
-                legend=dict(
-                    orientation="v",
-                    yanchor="middle",
-                    y=0.5,
-                    xanchor="left",
-                    x=1.1
-                )
-            )
+            fig_pie = build_segment_pie(segment_counts, overview['segment_colors'])
             
             st.plotly_chart(fig_pie, use_container_width=True)
         
         with col_explore:
             st.markdown("#### 🔍 Explore Segments:")
             
-            # Order segments from negative to positive
-            segment_order = [
-                'Below Standard Performance',
-                'Low Demand, Quality Gap',
-                'High Demand, Minor Gap',
-                'Underutilized Quality',
-                'High Demand, Good Quality',
-                'Meeting Expectations'
-            ]
-            
             # Filter to only segments that exist in data
-            available_segments = [seg for seg in segment_order if seg in segment_counts.index]
+            available_segments = [seg for seg in SEGMENT_ORDER if seg in segment_counts.index]
             
-            # Create colored buttons for each segment
+            # Create a button for each segment
             for segment in available_segments:
                 count = segment_counts[segment]
-                color = get_segment_color(segment)
-                
-                # Create button with colored background using markdown
-                button_html = f"""
-                <style>
-                .segment-button-{segment.replace(' ', '-').replace(',', '')} {{
-                    background-color: {color};
-                    color: white;
-                    padding: 15px;
-                    border-radius: 8px;
-                    margin: 8px 0;
-                    text-align: center;
-                    font-weight: 600;
-                    cursor: pointer;
-                    border: none;
-                    width: 100%;
-                    display: block;
-                }}
-                </style>
-                """
-                st.markdown(button_html, unsafe_allow_html=True)
                 
                 if st.button(
                     f"{segment} ({count} categories)",
@@ -875,34 +1339,9 @@ else:
         with col_priority1:
             st.markdown("#### 🔥 Top Problems by Business Priority")
             
-            problems_df = df_q1[df_q1['Business Priority (0-100)'] > 0].nlargest(
-                10, 'Business Priority (0-100)'
-            )
-            
-            fig_problems = go.Figure()
+            problems_df = overview['problems_df']
             
-            fig_problems.add_trace(go.Bar(
-                y=problems_df['Feature Category'],
-                x=problems_df['Business Priority (0-100)'],
-                orientation='h',
-                marker=dict(
-                    color=problems_df['Business Priority (0-100)'],
-                    colorscale='Reds',
-                    showscale=False
-                ),
-                text=problems_df['Business Priority (0-100)'].astype(int),
-                textposition='outside',
-                hovertemplate='<b>%{y}</b><br>Business Priority: %{x}/100<br>%{customdata}<extra></extra>',
-                customdata=problems_df['Action Timeline']
-            ))
-            
-            fig_problems.update_layout(
-                height=500,
-                xaxis_title="Business Priority Score",
-                yaxis_title="",
-                yaxis={'categoryorder': 'total ascending'},
-                showlegend=False
-            )
+            fig_problems = build_problems_chart(problems_df)
             
             st.plotly_chart(fig_problems, use_container_width=True)
             
@@ -916,63 +1355,27 @@ else:
         with col_priority2:
             st.markdown("#### ⚠️ Highest Quality Severity Issues")
             
-            severity_chart_df = df_q1[df_q1['Quality Severity (0-100)'] >= 25].nlargest(
-                10, 'Quality Severity (0-100)'
-            )
-            
-            fig_severity = go.Figure()
-            
-            fig_severity.add_trace(go.Bar(
-                y=severity_chart_df['Feature Category'],
-                x=severity_chart_df['Quality Severity (0-100)'],
-                orientation='h',
-                marker=dict(
-                    color=severity_chart_df['Quality Severity (0-100)'],
-                    colorscale='Reds',
-                    showscale=False
-                ),
-                text=severity_chart_df['Quality Severity (0-100)'].astype(int),
-                textposition='outside',
-                hovertemplate='<b>%{y}</b><br>Quality Severity: %{x}/100<br>Gap: %{customdata[0]:.3f}★<br>Rating: %{customdata[1]:.2f}★<extra></extra>',
-                customdata=severity_chart_df[['Quality vs Median', 'Current Avg Rating']].values
-            ))
+            severity_chart_df = overview['severity_chart_df']
             
-            fig_severity.update_layout(
-                height=500,
-                xaxis_title="Quality Severity Score",
-                yaxis_title="",
-                yaxis={'categoryorder': 'total ascending'},
-                showlegend=False
-            )
-            
-            st.plotly_chart(fig_severity, use_container_width=True)
-            
-            st.markdown("""
-            <div class="metric-explanation">
-            Darker red = More severe quality problem (gap size + % low quality apps)
-            </div>
-            """, unsafe_allow_html=True)
+            # Nothing above the severity threshold: skip building an empty figure
+            if severity_chart_df.empty:
+                st.info("No quality severity issues to display.")
+            else:
+                fig_severity = build_severity_chart(severity_chart_df)
+                
+                st.plotly_chart(fig_severity, use_container_width=True)
+                
+                st.markdown("""
+                <div class="metric-explanation">
+                Darker red = More severe quality problem (gap size + % low quality apps)
+                </div>
+                """, unsafe_allow_html=True)
         
         # Combined View Details section
         st.markdown("---")
         st.markdown("### 🔍 View Details")
         
-        # Category selector
-        all_priority_cats = pd.concat([
-            problems_df['Feature Category'],
-            severity_chart_df['Feature Category']
-        ]).unique().tolist()
-        
-        selected_cat = st.selectbox(
-            "Select a category to view full analysis:",
-            all_priority_cats,
-            key='combined_cat_selector'
-        )
-        
-        if st.button("View Full Analysis", key='view_combined'):
-            st.session_state.current_view = 'category_detail'
-            st.session_state.selected_category = selected_cat
-            st.rerun()
+        render_priority_selector(overview['priority_categories'])
     
     # ========================================================================
     # TAB 3: PERFORMANCE INSIGHTS
@@ -981,35 +1384,7 @@ else:
         st.markdown("### 🎨 Category Performance Heatmap")
         st.markdown("*Visual overview of quality severity, merchant impact, and business priority across all categories*")
         
-        # Prepare data for heatmap - top 25 by business priority
-        heatmap_df = df_q1.nlargest(25, 'Business Priority (0-100)')[
-            ['Feature Category', 'Quality Severity (0-100)', 'Merchant Impact (0-100)', 
-             'Business Priority (0-100)', 'Current Avg Rating', 'Demand Level']
-        ].copy()
-        
-        # Create heatmap matrix
-        heatmap_data = heatmap_df[['Quality Severity (0-100)', 'Merchant Impact (0-100)', 
-                                     'Business Priority (0-100)']].T
-        
-        fig_heatmap = go.Figure(data=go.Heatmap(
-            z=heatmap_data.values,
-            x=heatmap_df['Feature Category'].values,
-            y=['Quality Severity', 'Merchant Impact', 'Business Priority'],
-            colorscale='RdYlGn_r',
-            text=heatmap_data.values.round(0).astype(int),
-            texttemplate='%{text}',
-            textfont={"size": 10},
-            hoverongaps=False,
-            hovertemplate='<b>%{y}</b><br>%{x}<br>Score: %{z:.0f}/100<extra></extra>',
-            colorbar=dict(title="Score")
-        ))
-        
-        fig_heatmap.update_layout(
-            title="Top 25 Categories by Business Priority - Score Breakdown",
-            height=400,
-            xaxis={'side': 'bottom', 'tickangle': -45},
-            yaxis_title="Metric"
-        )
+        fig_heatmap = build_heatmap_figure(overview['top25'])
         
         st.plotly_chart(fig_heatmap, use_container_width=True)
         
@@ -1031,29 +1406,19 @@ else:
         # ====================================================================
         st.markdown("### 📋 Complete Category Analysis")
         
-        # Get available columns from the dataframe
-        available_cols = df_q1.columns.tolist()
+        table_df = build_complete_table(df_q1)
         
-        # Define desired columns
-        desired_cols = [
-            'Feature Category', 'Strategic Segment', 'Demand Level',
-            'Quality Severity (0-100)', 'Merchant Impact (0-100)', 'Business Priority (0-100)',
-            'Priority Level (1-5)', 'Action Timeline', 'Current Avg Rating',
-            'Reviews Per App', 'Est. Merchants Affected', 'Predicted Churn %',
-            'Quality vs Median', '% Apps with 4.5+ Stars',
-            'Statistically Significant?'
-        ]
-        
-        # Only include columns that actually exist in the dataframe
-        display_cols = [col for col in desired_cols if col in available_cols]
-        
-        table_df = df_q1[display_cols].copy()
-        table_df = table_df.sort_values('Business Priority (0-100)', ascending=False)
-        
-        st.dataframe(table_df, use_container_width=True, height=600)
+        if len(table_df) > COMPLETE_TABLE_PAGE_ROWS:
+            top_n = st.slider(
+                "Rows to display", COMPLETE_TABLE_PAGE_ROWS, len(table_df),
+                COMPLETE_TABLE_PAGE_ROWS, key='complete_table_rows'
+            )
+            st.dataframe(table_df.head(top_n), use_container_width=True, height=600)
+        else:
+            st.dataframe(table_df, use_container_width=True, height=600)
         
         # Download button
-        csv = table_df.to_csv(index=False)
+        csv = to_csv_bytes(table_df)
         st.download_button(
             label="📥 Download Full Analysis (CSV)",
             data=csv,